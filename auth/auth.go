@@ -0,0 +1,39 @@
+// Package auth provides API key verification for the HTTP endpoints.
+package auth
+
+import (
+	"crypto/sha256"
+	"crypto/subtle"
+)
+
+// Key holds the SHA-256 digests of a configured API key.
+// The plaintext key is not retained, and checks only hash the presented value.
+type Key struct {
+	sum       [sha256.Size]byte // digest of the key itself
+	bearerSum [sha256.Size]byte // digest of "Bearer <key>"
+}
+
+// NewKey creates a Key for the given API key.
+func NewKey(apiKey string) *Key {
+	return &Key{
+		sum:       sha256.Sum256([]byte(apiKey)),
+		bearerSum: sha256.Sum256([]byte("Bearer " + apiKey)),
+	}
+}
+
+// Matches reports whether provided is the API key.
+func (k *Key) Matches(provided string) bool {
+	return digestMatches(provided, k.sum)
+}
+
+// MatchesBearer reports whether an Authorization header value carries the API key.
+func (k *Key) MatchesBearer(authHeader string) bool {
+	return digestMatches(authHeader, k.bearerSum)
+}
+
+// digestMatches compares the digest of provided with expected in constant time.
+// Comparing fixed-length digests avoids leaking the length of the expected secret.
+func digestMatches(provided string, expected [sha256.Size]byte) bool {
+	providedSum := sha256.Sum256([]byte(provided))
+	return subtle.ConstantTimeCompare(providedSum[:], expected[:]) == 1
+}
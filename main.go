@@ -25,7 +25,6 @@ package main
 
 import (
 	"context"
-	"crypto/subtle"
 	"fmt"
 	"log"
 	"net/http"
@@ -35,12 +34,14 @@ import (
 	"syscall"
 	"time"
 
+	"whatsapp-mcp/auth"
 	"whatsapp-mcp/mcp"
 	"whatsapp-mcp/paths"
 	"whatsapp-mcp/storage"
 	"whatsapp-mcp/webhook"
 	"whatsapp-mcp/whatsapp"
 
+	"github.com/google/uuid"
 	"github.com/joho/godotenv"
 	"github.com/mark3labs/mcp-go/server"
 	"github.com/mdp/qrterminal/v3"
@@ -53,6 +54,10 @@ import (
 // TODO: move and improve api/mcp endpoints registration
 
 func main() {
+	// draw webhook/event UUIDs from a buffered pool of crypto/rand bytes instead of
+	// one read per UUID; must be enabled before any goroutine generates UUIDs
+	uuid.EnableRandPool()
+
 	// load .env file
 	if err := godotenv.Load(); err != nil {
 		log.Println("Warning: .env file not found, using environment variables only")
@@ -108,7 +113,11 @@ func main() {
 	}
 	defer db.Close()
 
-	store := storage.NewMessageStore(db)
+	store, err := storage.NewMessageStore(db)
+	if err != nil {
+		log.Fatal("Failed to init message store:", err)
+	}
+	defer store.Close()
 	log.Println("Message storage initialized")
 
 	mediaStore := storage.NewMediaStore(db)
@@ -124,13 +133,14 @@ func main() {
 	// Note: Changing WEBHOOK_URL and restarting will update the existing "system:primary" webhook.
 	// The old URL will be replaced. To use multiple webhooks, register them via the API instead.
 	if webhookConfig.PrimaryURL != "" {
+		now := time.Now()
 		primaryWebhook := storage.WebhookRegistration{
 			ID:         "system:primary",
 			URL:        webhookConfig.PrimaryURL,
 			EventTypes: []string{"message"},
 			Active:     true,
-			CreatedAt:  time.Now(),
-			UpdatedAt:  time.Now(),
+			CreatedAt:  now,
+			UpdatedAt:  now,
 		}
 		// Use upsert to create or update the primary webhook
 		if err := webhookStore.UpsertWebhook(primaryWebhook); err != nil {
@@ -157,6 +167,7 @@ func main() {
 		ctx := context.Background()
 		qrChan, err := waClient.GetQRChannel(ctx)
 		if err != nil {
+			waClient.FlushLog()
 			log.Fatal("Failed to get QR channel:", err)
 		}
 
@@ -174,6 +185,7 @@ func main() {
 		log.Println("Already logged in")
 
 		if err := waClient.Connect(); err != nil {
+			waClient.FlushLog()
 			log.Fatal("Failed to connect:", err)
 		}
 		log.Println("Connected to WhatsApp")
@@ -195,6 +207,9 @@ func main() {
 		}
 	})
 
+	// only digests of the API key are kept for request authentication
+	key := auth.NewKey(apiKey)
+
 	streamableServer := server.NewStreamableHTTPServer(
 		mcpServer.GetServer(),
 		server.WithEndpointPath("/mcp"),
@@ -205,19 +220,17 @@ func main() {
 	// first path segment (/mcp/{apiKey}) for backward compatibility.
 	mux.HandleFunc("/mcp/", func(w http.ResponseWriter, r *http.Request) {
 		path := strings.TrimPrefix(r.URL.Path, "/mcp/")
-		providedKey := strings.Split(path, "/")[0] // first segment after /mcp/
-
-		authHeader := r.Header.Get("Authorization")
-		headerOK := subtle.ConstantTimeCompare([]byte(authHeader), []byte("Bearer "+apiKey)) == 1
-		pathOK := subtle.ConstantTimeCompare([]byte(providedKey), []byte(apiKey)) == 1
+		providedKey, _, _ := strings.Cut(path, "/") // first segment after /mcp/, without splitting the whole path
 
 		// remainingPath is the MCP path after the auth segment is stripped.
+		// Cases are evaluated in order, so the path key is only checked when
+		// the header doesn't match.
 		var remainingPath string
 		switch {
-		case headerOK:
+		case key.MatchesBearer(r.Header.Get("Authorization")):
 			// Key is in the header; the whole path after /mcp/ is the MCP path.
 			remainingPath = path
-		case pathOK:
+		case key.Matches(providedKey):
 			// Key is in the path; strip it.
 			remainingPath = strings.TrimPrefix(path, providedKey)
 		default:
@@ -236,32 +249,9 @@ func main() {
 	})
 
 	// Webhook management API
-	webhookHandler := webhook.NewHandler(webhookManager, webhookStore, apiKey)
-
-	mux.HandleFunc("/api/webhooks", func(w http.ResponseWriter, r *http.Request) {
-		if !webhookHandler.ValidateAuth(r) {
-			http.Error(w, `{"error":"Unauthorized"}`, http.StatusUnauthorized)
-			return
-		}
+	webhookHandler := webhook.NewHandler(webhookManager, webhookStore, key)
 
-		switch r.Method {
-		case http.MethodPost:
-			webhookHandler.CreateWebhook(w, r)
-		case http.MethodGet:
-			webhookHandler.ListWebhooks(w, r)
-		default:
-			http.Error(w, `{"error":"Method not allowed"}`, http.StatusMethodNotAllowed)
-		}
-	})
-
-	mux.HandleFunc("/api/webhooks/", func(w http.ResponseWriter, r *http.Request) {
-		if !webhookHandler.ValidateAuth(r) {
-			http.Error(w, `{"error":"Unauthorized"}`, http.StatusUnauthorized)
-			return
-		}
-
-		webhookHandler.HandleWebhookByID(w, r)
-	})
+	webhookHandler.RegisterRoutes(mux)
 
 	httpServer := &http.Server{
 		Addr:    host + ":" + httpPort,
@@ -274,6 +264,7 @@ func main() {
 		log.Printf("- Health check: http://%s:%s/health", host, httpPort)
 		log.Printf("- MCP endpoint: http://%s:%s/mcp/{API_KEY}", host, httpPort)
 		if err := httpServer.ListenAndServe(); err != nil && err != http.ErrServerClosed {
+			waClient.FlushLog()
 			log.Fatalf("Server error: %v", err)
 		}
 	}()
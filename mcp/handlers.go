@@ -50,16 +50,17 @@ func (m *MCPServer) formatTime(t time.Time) string {
 	return m.toLocalTime(t).Format("15:04:05")
 }
 
+// timestampFormats lists the layouts accepted by parseTimestamp, tried in order.
+var timestampFormats = []string{
+	"2006-01-02T15:04:05",
+	"2006-01-02 15:04:05",
+	"2006-01-02",
+}
+
 // parseTimestamp converts an ISO 8601 timestamp string to time.Time in the server's timezone.
 // It supports the formats: "2006-01-02T15:04:05", "2006-01-02 15:04:05", "2006-01-02".
 func (m *MCPServer) parseTimestamp(timestampStr string) (time.Time, error) {
-	formats := []string{
-		"2006-01-02T15:04:05",
-		"2006-01-02 15:04:05",
-		"2006-01-02",
-	}
-
-	for _, format := range formats {
+	for _, format := range timestampFormats {
 		if t, err := time.ParseInLocation(format, timestampStr, m.timezone); err == nil {
 			return t, nil
 		}
@@ -16,16 +16,27 @@ type Chat struct {
 	IsGroup         bool
 }
 
-// GetChatByJID retrieves a chat by its canonical JID.
-// It returns nil if the chat is not found.
-func (s *MessageStore) GetChatByJID(jid string) (*Chat, error) {
-	query := `
+const getChatQuery = `
 	SELECT jid, push_name, contact_name, last_message_time, unread_count, is_group
 	FROM chats
 	WHERE jid = ?
 	`
 
-	row := s.db.QueryRow(query, jid)
+const saveChatQuery = `
+	INSERT INTO chats (jid, push_name, contact_name, last_message_time, unread_count, is_group)
+	VALUES (?, ?, ?, ?, ?, ?)
+	ON CONFLICT(jid) DO UPDATE SET
+	    push_name = COALESCE(NULLIF(excluded.push_name, ''), chats.push_name),
+	    contact_name = COALESCE(NULLIF(excluded.contact_name, ''), chats.contact_name),
+	    last_message_time = excluded.last_message_time,
+	    unread_count = excluded.unread_count,
+	    is_group = excluded.is_group
+	`
+
+// GetChatByJID retrieves a chat by its canonical JID.
+// It returns nil if the chat is not found.
+func (s *MessageStore) GetChatByJID(jid string) (*Chat, error) {
+	row := s.getChatStmt.QueryRow(jid)
 
 	var chat Chat
 	var lastMsgUnix int64
@@ -57,19 +68,7 @@ func (s *MessageStore) SaveChat(chat Chat) error {
 		return fmt.Errorf("chat JID cannot be empty")
 	}
 
-	query := `
-	INSERT INTO chats (jid, push_name, contact_name, last_message_time, unread_count, is_group)
-	VALUES (?, ?, ?, ?, ?, ?)
-	ON CONFLICT(jid) DO UPDATE SET
-	    push_name = COALESCE(NULLIF(excluded.push_name, ''), chats.push_name),
-	    contact_name = COALESCE(NULLIF(excluded.contact_name, ''), chats.contact_name),
-	    last_message_time = excluded.last_message_time,
-	    unread_count = excluded.unread_count,
-	    is_group = excluded.is_group
-	`
-
-	_, err := s.db.Exec(
-		query,
+	_, err := s.saveChatStmt.Exec(
 		chat.JID,
 		chat.PushName,
 		chat.ContactName,
@@ -81,6 +80,43 @@ func (s *MessageStore) SaveChat(chat Chat) error {
 	return err
 }
 
+// SaveChats saves or updates multiple chats in a single transaction.
+// This is optimized for history sync operations.
+func (s *MessageStore) SaveChats(chats []Chat) error {
+	if len(chats) == 0 {
+		return nil
+	}
+
+	tx, err := s.db.Begin()
+	if err != nil {
+		return err
+	}
+	defer tx.Rollback()
+
+	stmt := tx.Stmt(s.saveChatStmt)
+	defer stmt.Close()
+
+	for _, chat := range chats {
+		if chat.JID == "" {
+			return fmt.Errorf("chat JID cannot be empty")
+		}
+
+		_, err := stmt.Exec(
+			chat.JID,
+			chat.PushName,
+			chat.ContactName,
+			chat.LastMessageTime.Unix(),
+			chat.UnreadCount,
+			chat.IsGroup,
+		)
+		if err != nil {
+			return fmt.Errorf("failed to save chat %s: %w", chat.JID, err)
+		}
+	}
+
+	return tx.Commit()
+}
+
 // ListChats returns all chats ordered by last message timestamp.
 func (s *MessageStore) ListChats(limit int) ([]Chat, error) {
 	query := `
@@ -176,44 +212,3 @@ func (s *MessageStore) SearchChatsFiltered(search string, useGlob bool, limit in
 
 	return chats, rows.Err()
 }
-
-// SearchChats searches chats by name or JID with fuzzy matching.
-func (s *MessageStore) SearchChats(search string, limit int) ([]Chat, error) {
-	query := `
-	SELECT jid, push_name, contact_name, last_message_time, unread_count, is_group
-	FROM chats
-	WHERE push_name LIKE ? OR contact_name LIKE ? OR jid LIKE ?
-	ORDER BY last_message_time DESC
-	LIMIT ?
-	`
-
-	searchPattern := "%" + search + "%"
-	rows, err := s.db.Query(query, searchPattern, searchPattern, searchPattern, limit)
-	if err != nil {
-		return nil, err
-	}
-	defer rows.Close()
-
-	var chats []Chat
-	for rows.Next() {
-		var chat Chat
-		var lastMsgUnix int64
-
-		err := rows.Scan(
-			&chat.JID,
-			&chat.PushName,
-			&chat.ContactName,
-			&lastMsgUnix,
-			&chat.UnreadCount,
-			&chat.IsGroup,
-		)
-		if err != nil {
-			return nil, err
-		}
-
-		chat.LastMessageTime = time.Unix(lastMsgUnix, 0)
-		chats = append(chats, chat)
-	}
-
-	return chats, rows.Err()
-}
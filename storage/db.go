@@ -3,14 +3,22 @@ package storage
 import (
 	"database/sql"
 	"fmt"
+	"time"
 	"whatsapp-mcp/paths"
 
 	_ "modernc.org/sqlite"
 )
 
-// GetConnectionString returns the SQLite connection string with pragmas
+// maxOpenConns bounds the connection pool. WAL mode allows concurrent readers
+// alongside a single writer, so a small pool serves MCP requests, webhook
+// workers and media downloads in parallel.
+const maxOpenConns = 8
+
+// GetConnectionString returns the SQLite connection string with pragmas.
+// synchronous(NORMAL) skips the fsync on every commit; in WAL mode this is
+// still safe against corruption, only the last transactions may be lost on power failure.
 func GetConnectionString() string {
-	return paths.MessagesDBPath + "?_pragma=foreign_keys(1)&_pragma=journal_mode(WAL)&_pragma=busy_timeout(5000)"
+	return paths.MessagesDBPath + "?_pragma=foreign_keys(1)&_pragma=journal_mode(WAL)&_pragma=synchronous(NORMAL)&_pragma=busy_timeout(5000)"
 }
 
 // InitDB initializes the database and runs migrations
@@ -21,6 +29,12 @@ func InitDB() (*sql.DB, error) {
 		return nil, err
 	}
 
+	// keep idle connections around so requests don't reopen the database file
+	// and re-run the connection pragmas (database/sql keeps only 2 by default)
+	db.SetMaxOpenConns(maxOpenConns)
+	db.SetMaxIdleConns(maxOpenConns)
+	db.SetConnMaxIdleTime(10 * time.Minute)
+
 	if err := db.Ping(); err != nil {
 		return nil, err
 	}
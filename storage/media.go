@@ -36,23 +36,56 @@ func NewMediaStore(db *sql.DB) *MediaStore {
 	return &MediaStore{db: db}
 }
 
-// SaveMediaMetadata inserts or updates media metadata in the database.
-func (s *MediaStore) SaveMediaMetadata(meta MediaMetadata) error {
-	query := `
+const saveMediaMetadataQuery = `
 	INSERT OR REPLACE INTO media_metadata
 	(message_id, file_path, file_name, file_size, mime_type, width, height, duration,
 	 media_key, direct_path, file_sha256, file_enc_sha256, download_status, download_timestamp, download_error)
 	VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 	`
 
+// SaveMediaMetadata inserts or updates media metadata in the database.
+func (s *MediaStore) SaveMediaMetadata(meta MediaMetadata) error {
+	_, err := s.db.Exec(saveMediaMetadataQuery, mediaMetadataArgs(meta)...)
+	return err
+}
+
+// SaveMediaMetadataBulk inserts or updates multiple media metadata records in a single transaction.
+// This is optimized for history sync operations.
+func (s *MediaStore) SaveMediaMetadataBulk(metas []MediaMetadata) error {
+	if len(metas) == 0 {
+		return nil
+	}
+
+	tx, err := s.db.Begin()
+	if err != nil {
+		return err
+	}
+	defer tx.Rollback()
+
+	stmt, err := tx.Prepare(saveMediaMetadataQuery)
+	if err != nil {
+		return err
+	}
+	defer stmt.Close()
+
+	for _, meta := range metas {
+		if _, err := stmt.Exec(mediaMetadataArgs(meta)...); err != nil {
+			return fmt.Errorf("failed to save media metadata for %s: %w", meta.MessageID, err)
+		}
+	}
+
+	return tx.Commit()
+}
+
+// mediaMetadataArgs returns the query arguments for saveMediaMetadataQuery.
+func mediaMetadataArgs(meta MediaMetadata) []any {
 	var downloadTimestampUnix *int64
 	if meta.DownloadTimestamp != nil {
 		ts := meta.DownloadTimestamp.Unix()
 		downloadTimestampUnix = &ts
 	}
 
-	_, err := s.db.Exec(
-		query,
+	return []any{
 		meta.MessageID,
 		meta.FilePath,
 		meta.FileName,
@@ -68,9 +101,7 @@ func (s *MediaStore) SaveMediaMetadata(meta MediaMetadata) error {
 		meta.DownloadStatus,
 		downloadTimestampUnix,
 		meta.DownloadError,
-	)
-
-	return err
+	}
 }
 
 // GetMediaMetadata retrieves media metadata by message ID.
@@ -79,7 +110,7 @@ func (s *MediaStore) GetMediaMetadata(messageID string) (*MediaMetadata, error)
 	query := `
 	SELECT message_id, file_path, file_name, file_size, mime_type, width, height, duration,
 	       media_key, direct_path, file_sha256, file_enc_sha256, download_status,
-	       download_timestamp, download_error, created_at
+	       download_timestamp, download_error, CAST(strftime('%s', created_at) AS INTEGER)
 	FROM media_metadata
 	WHERE message_id = ?
 	`
@@ -90,7 +121,7 @@ func (s *MediaStore) GetMediaMetadata(messageID string) (*MediaMetadata, error)
 	var mediaKey, fileSHA256, fileEncSHA256 []byte
 	var directPath, downloadError sql.NullString
 	var downloadTimestampUnix sql.NullInt64
-	var createdAtStr string
+	var createdAtUnix sql.NullInt64
 
 	err := s.db.QueryRow(query, messageID).Scan(
 		&meta.MessageID,
@@ -108,7 +139,7 @@ func (s *MediaStore) GetMediaMetadata(messageID string) (*MediaMetadata, error)
 		&meta.DownloadStatus,
 		&downloadTimestampUnix,
 		&downloadError,
-		&createdAtStr,
+		&createdAtUnix,
 	)
 
 	if err == sql.ErrNoRows {
@@ -149,8 +180,10 @@ func (s *MediaStore) GetMediaMetadata(messageID string) (*MediaMetadata, error)
 	meta.FileSHA256 = fileSHA256
 	meta.FileEncSHA256 = fileEncSHA256
 
-	// parse created_at
-	meta.CreatedAt, _ = time.Parse("2006-01-02 15:04:05", createdAtStr)
+	// created_at is read as a Unix timestamp, like the other timestamp columns
+	if createdAtUnix.Valid {
+		meta.CreatedAt = time.Unix(createdAtUnix.Int64, 0)
+	}
 
 	return &meta, nil
 }
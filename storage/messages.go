@@ -2,6 +2,7 @@ package storage
 
 import (
 	"database/sql"
+	"errors"
 	"fmt"
 	"time"
 )
@@ -41,29 +42,71 @@ type MessageWithNames struct {
 // MessageStore handles message operations on the database.
 type MessageStore struct {
 	db *sql.DB
-}
 
-// NewMessageStore creates a new message store instance.
-func NewMessageStore(db *sql.DB) *MessageStore {
-	return &MessageStore{db: db}
+	// prepared statements for queries that run on every incoming message
+	saveMessageStmt  *sql.Stmt
+	saveChatStmt     *sql.Stmt
+	getChatStmt      *sql.Stmt
+	savePushNameStmt *sql.Stmt
 }
 
-// SaveMessage saves a WhatsApp message to the database.
-func (s *MessageStore) SaveMessage(msg Message) error {
-	query := `
+const saveMessageQuery = `
 	INSERT OR REPLACE INTO messages
 	(id, chat_jid, sender_jid, text, timestamp, is_from_me, message_type, reply_to_id)
 	VALUES (?, ?, ?, ?, ?, ?, ?, ?)
 	`
 
+// NewMessageStore creates a new message store instance and prepares its hot-path statements.
+func NewMessageStore(db *sql.DB) (*MessageStore, error) {
+	s := &MessageStore{db: db}
+
+	statements := []struct {
+		stmt  **sql.Stmt
+		query string
+	}{
+		{&s.saveMessageStmt, saveMessageQuery},
+		{&s.saveChatStmt, saveChatQuery},
+		{&s.getChatStmt, getChatQuery},
+		{&s.savePushNameStmt, savePushNameQuery},
+	}
+
+	for _, st := range statements {
+		stmt, err := db.Prepare(st.query)
+		if err != nil {
+			s.Close()
+			return nil, fmt.Errorf("failed to prepare statement: %w", err)
+		}
+		*st.stmt = stmt
+	}
+
+	return s, nil
+}
+
+// Close releases the prepared statements. The underlying database is left open.
+func (s *MessageStore) Close() error {
+	var errs []error
+	for _, stmt := range []*sql.Stmt{s.saveMessageStmt, s.saveChatStmt, s.getChatStmt, s.savePushNameStmt} {
+		if stmt != nil {
+			if err := stmt.Close(); err != nil {
+				errs = append(errs, err)
+			}
+		}
+	}
+	if err := errors.Join(errs...); err != nil {
+		return fmt.Errorf("failed to close statements: %w", err)
+	}
+	return nil
+}
+
+// SaveMessage saves a WhatsApp message to the database.
+func (s *MessageStore) SaveMessage(msg Message) error {
 	// Use nil for empty reply_to_id
 	var replyToID interface{}
 	if msg.ReplyToID != "" {
 		replyToID = msg.ReplyToID
 	}
 
-	_, err := s.db.Exec(
-		query,
+	_, err := s.saveMessageStmt.Exec(
 		msg.ID,
 		msg.ChatJID,
 		msg.SenderJID,
@@ -92,15 +135,7 @@ func (s *MessageStore) SaveBulk(messages []Message) error {
 
 	defer tx.Rollback()
 
-	stmt, err := tx.Prepare(`
-	INSERT OR REPLACE INTO messages
-	(id, chat_jid, sender_jid, text, timestamp, is_from_me, message_type, reply_to_id)
-	VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-	`)
-	if err != nil {
-		return err
-	}
-
+	stmt := tx.Stmt(s.saveMessageStmt)
 	defer stmt.Close()
 
 	for _, msg := range messages {
@@ -130,45 +165,6 @@ func (s *MessageStore) SaveBulk(messages []Message) error {
 
 }
 
-// SearchMessages searches messages by text content.
-func (s *MessageStore) SearchMessages(q string, limit int) ([]Message, error) {
-	query := `
-	SELECT id, chat_jid, sender_jid, text, timestamp, is_from_me, message_type
-	FROM messages
-	WHERE text LIKE ?
-	ORDER BY timestamp DESC
-	LIMIT ?
-	`
-
-	rows, err := s.db.Query(query, "%"+q+"%", limit)
-	if err != nil {
-		return nil, err
-	}
-
-	defer rows.Close()
-
-	return s.scanMessages(rows)
-}
-
-// GetChatMessages retrieves messages from a specific chat.
-func (s *MessageStore) GetChatMessages(chatJID string, limit int, offset int) ([]Message, error) {
-	query := `
-	SELECT id, chat_jid, sender_jid, text, timestamp, is_from_me, message_type
-	FROM messages
-	WHERE chat_jid = ?
-	ORDER BY timestamp DESC
-	LIMIT ? OFFSET ?
-	`
-
-	rows, err := s.db.Query(query, chatJID, limit, offset)
-	if err != nil {
-		return nil, err
-	}
-	defer rows.Close()
-
-	return s.scanMessages(rows)
-}
-
 // GetMessageByID retrieves a message by its ID.
 // It returns nil if the message is not found.
 func (s *MessageStore) GetMessageByID(messageID string) (*Message, error) {
@@ -318,34 +314,6 @@ func (s *MessageStore) GetChatMessagesWithNamesFiltered(
 	return s.scanMessagesWithNames(rows)
 }
 
-// scanMessages converts SQL rows into Message objects.
-func (s *MessageStore) scanMessages(rows *sql.Rows) ([]Message, error) {
-	var messages []Message
-
-	for rows.Next() {
-		var msg Message
-		var timestampUnix int64
-
-		err := rows.Scan(
-			&msg.ID,
-			&msg.ChatJID,
-			&msg.SenderJID,
-			&msg.Text,
-			&timestampUnix,
-			&msg.IsFromMe,
-			&msg.MessageType,
-		)
-		if err != nil {
-			return nil, err
-		}
-
-		msg.Timestamp = time.Unix(timestampUnix, 0)
-		messages = append(messages, msg)
-	}
-
-	return messages, rows.Err()
-}
-
 // SearchMessagesWithNamesFiltered searches messages with pattern matching and sender filtering.
 // It uses GLOB patterns if useGlob is true, otherwise uses LIKE for fuzzy matching.
 func (s *MessageStore) SearchMessagesWithNamesFiltered(
@@ -400,30 +368,6 @@ func (s *MessageStore) SearchMessagesWithNamesFiltered(
 	return s.scanMessagesWithNames(rows)
 }
 
-// SearchMessagesWithNames searches messages and includes sender names from view
-func (s *MessageStore) SearchMessagesWithNames(q string, limit int) ([]MessageWithNames, error) {
-	query := `
-	SELECT id, chat_jid, sender_jid, sender_push_name, sender_contact_name, chat_name,
-	       text, timestamp, is_from_me, message_type,
-	       media_file_path, media_file_name, media_file_size, media_mime_type,
-	       media_width, media_height, media_duration, media_download_status,
-	       media_download_timestamp, media_download_error
-	FROM messages_with_names
-	WHERE text LIKE ?
-	ORDER BY timestamp DESC
-	LIMIT ?
-	`
-
-	rows, err := s.db.Query(query, "%"+q+"%", limit)
-	if err != nil {
-		return nil, err
-	}
-
-	defer rows.Close()
-
-	return s.scanMessagesWithNames(rows)
-}
-
 // GetChatMessagesWithNames gets chat messages and includes sender names from view
 func (s *MessageStore) GetChatMessagesWithNames(chatJID string, limit int, offset int) ([]MessageWithNames, error) {
 	query := `
@@ -0,0 +1,16 @@
+-- Migration: 004_add_lookup_indexes
+-- Description: Add indexes for chat listing and webhook delivery stats
+-- Previous: 003
+-- Version: 004
+-- Created: 2026-10-14
+
+-- list_chats/find_chat order by most recent activity; without this index
+-- every call scans and sorts the whole chats table
+CREATE INDEX IF NOT EXISTS idx_chats_last_message_time ON chats(last_message_time DESC);
+
+-- GetDeliveryStats filters by webhook and time window
+CREATE INDEX IF NOT EXISTS idx_deliveries_webhook_attempted ON webhook_deliveries(webhook_id, attempted_at);
+
+-- webhook_id is the prefix of the composite index above, so the single-column
+-- index from 002 only adds write cost to every delivery insert
+DROP INDEX IF EXISTS idx_deliveries_webhook;
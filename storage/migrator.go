@@ -4,6 +4,7 @@ import (
 	"crypto/sha256"
 	"database/sql"
 	"embed"
+	"encoding/hex"
 	"fmt"
 	"log"
 	"regexp"
@@ -17,6 +18,9 @@ import (
 //go:embed migrations/*.sql
 var migrationsFS embed.FS
 
+// migrationPattern matches migration filenames like 001_initial_schema.sql.
+var migrationPattern = regexp.MustCompile(`^(\d{3})_(.+)\.sql$`)
+
 // Migration represents a single database migration
 type Migration struct {
 	Version     int
@@ -117,8 +121,6 @@ func (m *Migrator) loadMigrations() ([]Migration, error) {
 	}
 
 	// parse each .sql file
-	migrationPattern := regexp.MustCompile(`^(\d{3})_(.+)\.sql$`)
-
 	for _, entry := range entries {
 		if entry.IsDir() {
 			continue
@@ -147,7 +149,7 @@ func (m *Migrator) loadMigrations() ([]Migration, error) {
 
 		// calculate checksum
 		hash := sha256.Sum256(content)
-		checksum := fmt.Sprintf("%x", hash)
+		checksum := hex.EncodeToString(hash[:])
 
 		migrations = append(migrations, Migration{
 			Version:     version,
@@ -177,20 +179,20 @@ func (m *Migrator) loadMigrations() ([]Migration, error) {
 
 // validateAppliedMigrations validates that already-applied migrations haven't been modified
 func (m *Migrator) validateAppliedMigrations(migrations []Migration, currentVersion int) error {
+	// load all stored checksums in a single query
+	storedChecksums, err := m.getAppliedChecksums()
+	if err != nil {
+		return fmt.Errorf("failed to load applied migration checksums: %w", err)
+	}
+
 	for _, migration := range migrations {
 		if migration.Version > currentVersion {
 			// this migration hasn't been applied yet, skip validation
 			continue
 		}
 
-		// get the stored checksum from database
-		var storedChecksum string
-		err := m.db.QueryRow(
-			"SELECT checksum FROM schema_migrations WHERE version = ?",
-			migration.Version,
-		).Scan(&storedChecksum)
-
-		if err != nil {
+		storedChecksum, ok := storedChecksums[migration.Version]
+		if !ok {
 			return fmt.Errorf("migration %d (%s) is missing from schema_migrations table. Database may be corrupted or partially migrated",
 				migration.Version, migration.Filename)
 		}
@@ -209,6 +211,27 @@ func (m *Migrator) validateAppliedMigrations(migrations []Migration, currentVers
 	return nil
 }
 
+// getAppliedChecksums returns the stored checksum of every applied migration, keyed by version
+func (m *Migrator) getAppliedChecksums() (map[int]string, error) {
+	rows, err := m.db.Query("SELECT version, checksum FROM schema_migrations")
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+
+	checksums := make(map[int]string)
+	for rows.Next() {
+		var version int
+		var checksum string
+		if err := rows.Scan(&version, &checksum); err != nil {
+			return nil, err
+		}
+		checksums[version] = checksum
+	}
+
+	return checksums, rows.Err()
+}
+
 // filterPendingMigrations filters migrations to only those not yet applied
 func (m *Migrator) filterPendingMigrations(migrations []Migration, currentVersion int) []Migration {
 	var pending []Migration
@@ -6,6 +6,14 @@ import (
 	"time"
 )
 
+const savePushNameQuery = `
+		INSERT INTO push_names (jid, push_name, updated_at)
+		VALUES (?, ?, ?)
+		ON CONFLICT(jid) DO UPDATE SET
+			push_name = excluded.push_name,
+			updated_at = excluded.updated_at
+	`
+
 // SavePushNames saves multiple push names in a single transaction.
 // This is typically called from HistorySync events.
 func (s *MessageStore) SavePushNames(pushNames map[string]string) error {
@@ -19,16 +27,7 @@ func (s *MessageStore) SavePushNames(pushNames map[string]string) error {
 	}
 	defer tx.Rollback()
 
-	stmt, err := tx.Prepare(`
-		INSERT INTO push_names (jid, push_name, updated_at)
-		VALUES (?, ?, ?)
-		ON CONFLICT(jid) DO UPDATE SET
-			push_name = excluded.push_name,
-			updated_at = excluded.updated_at
-	`)
-	if err != nil {
-		return err
-	}
+	stmt := tx.Stmt(s.savePushNameStmt)
 	defer stmt.Close()
 
 	now := time.Now().Unix()
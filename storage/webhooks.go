@@ -221,13 +221,15 @@ func (s *WebhookStore) ListWebhooks(activeOnly bool) ([]WebhookRegistration, err
 }
 
 // UpdateWebhook updates an existing webhook registration.
-func (s *WebhookStore) UpdateWebhook(reg WebhookRegistration) error {
+// On success reg.UpdatedAt holds the stored timestamp, so callers don't need to re-read the row.
+func (s *WebhookStore) UpdateWebhook(reg *WebhookRegistration) error {
 	eventTypesJSON, err := json.Marshal(reg.EventTypes)
 	if err != nil {
 		return fmt.Errorf("failed to marshal event types: %w", err)
 	}
 
-	reg.UpdatedAt = time.Now()
+	// stored with second precision
+	updatedAt := time.Now().Truncate(time.Second)
 
 	query := `
 		UPDATE webhook_registrations
@@ -240,7 +242,7 @@ func (s *WebhookStore) UpdateWebhook(reg WebhookRegistration) error {
 		reg.Secret,
 		string(eventTypesJSON),
 		reg.Active,
-		reg.UpdatedAt.Unix(),
+		updatedAt.Unix(),
 		reg.ID,
 	)
 
@@ -257,6 +259,8 @@ func (s *WebhookStore) UpdateWebhook(reg WebhookRegistration) error {
 		return fmt.Errorf("webhook not found: %s", reg.ID)
 	}
 
+	reg.UpdatedAt = updatedAt
+
 	return nil
 }
 
@@ -14,6 +14,7 @@ type Config struct {
 	DeliveryTimeout   time.Duration   // HTTP request timeout
 	WorkerPoolSize    int             // Number of concurrent delivery workers
 	ChannelBufferSize int             // Size of delivery queue buffer
+	CacheTTL          time.Duration   // How long active webhook registrations are cached
 }
 
 // LoadConfig loads webhook configuration from environment variables.
@@ -33,5 +34,6 @@ func LoadConfig() *Config {
 		DeliveryTimeout:   time.Duration(config.GetEnvInt("WEBHOOK_TIMEOUT_SECONDS", 10)) * time.Second,
 		WorkerPoolSize:    config.GetEnvInt("WEBHOOK_WORKER_POOL_SIZE", 3),
 		ChannelBufferSize: 100,
+		CacheTTL:          30 * time.Second,
 	}
 }
@@ -15,18 +15,27 @@ import (
 )
 
 // deliverWebhook sends a webhook payload via HTTP POST with retry logic.
-func (m *WebhookManager) deliverWebhook(webhook storage.WebhookRegistration, payload WebhookPayload, attempt int) error {
+func (m *WebhookManager) deliverWebhook(task *deliveryTask) error {
+	webhook, payload, attempt := task.webhook, task.payload, task.attempt
+
 	m.log.Printf("Delivering webhook: webhook_id=%s payload_id=%s attempt=%d url=%s",
 		webhook.ID, payload.ID, attempt, webhook.URL)
 
-	// Serialize payload to JSON
-	jsonData, err := json.Marshal(payload)
-	if err != nil {
-		return m.recordFailure(webhook, payload, attempt, 0, fmt.Errorf("failed to marshal payload: %w", err))
+	// Serialize and sign the payload once; retries reuse the same body and signature.
+	// EmitMessageEvent pre-serializes the body shared by all subscribers of an event.
+	if task.body == nil {
+		jsonData, err := json.Marshal(payload)
+		if err != nil {
+			return m.recordFailure(webhook, payload, attempt, 0, fmt.Errorf("failed to marshal payload: %w", err))
+		}
+		task.body = jsonData
+	}
+	if task.signature == "" && webhook.Secret != "" {
+		task.signature = calculateSignature(task.body, webhook.Secret)
 	}
 
 	// Create HTTP request
-	req, err := http.NewRequest("POST", webhook.URL, bytes.NewBuffer(jsonData))
+	req, err := http.NewRequest("POST", webhook.URL, bytes.NewReader(task.body))
 	if err != nil {
 		return m.recordFailure(webhook, payload, attempt, 0, fmt.Errorf("failed to create request: %w", err))
 	}
@@ -37,10 +46,9 @@ func (m *WebhookManager) deliverWebhook(webhook storage.WebhookRegistration, pay
 	req.Header.Set("X-Webhook-ID", webhook.ID)
 	req.Header.Set("X-Event-ID", payload.ID)
 
-	// Calculate HMAC signature if secret is configured
-	if webhook.Secret != "" {
-		signature := calculateSignature(jsonData, webhook.Secret)
-		req.Header.Set("X-Webhook-Signature", signature)
+	// Attach HMAC signature if secret is configured
+	if task.signature != "" {
+		req.Header.Set("X-Webhook-Signature", task.signature)
 	}
 
 	resp, err := m.httpClient.Do(req)
@@ -58,6 +66,9 @@ func (m *WebhookManager) deliverWebhook(webhook storage.WebhookRegistration, pay
 			fmt.Errorf("unexpected status code %d: %s", resp.StatusCode, string(body)))
 	}
 
+	// Drain the body so the keep-alive connection goes back to the pool
+	_, _ = io.Copy(io.Discard, io.LimitReader(resp.Body, 64*1024))
+
 	// Success!
 	m.log.Printf("Webhook delivered successfully: webhook_id=%s payload_id=%s status=%d",
 		webhook.ID, payload.ID, resp.StatusCode)
@@ -1,14 +1,13 @@
 package webhook
 
 import (
-	"crypto/subtle"
 	"encoding/json"
 	"fmt"
 	"net/http"
 	"net/url"
-	"strings"
 	"time"
 
+	"whatsapp-mcp/auth"
 	"whatsapp-mcp/storage"
 
 	"github.com/google/uuid"
@@ -18,7 +17,7 @@ import (
 type Handler struct {
 	manager *WebhookManager
 	store   *storage.WebhookStore
-	apiKey  string
+	apiKey  *auth.Key
 }
 
 // errorResponse writes a properly escaped JSON error response.
@@ -33,7 +32,7 @@ func errorResponse(w http.ResponseWriter, message string, statusCode int) {
 }
 
 // NewHandler creates a new webhook HTTP handler.
-func NewHandler(manager *WebhookManager, store *storage.WebhookStore, apiKey string) *Handler {
+func NewHandler(manager *WebhookManager, store *storage.WebhookStore, apiKey *auth.Key) *Handler {
 	return &Handler{
 		manager: manager,
 		store:   store,
@@ -43,9 +42,18 @@ func NewHandler(manager *WebhookManager, store *storage.WebhookStore, apiKey str
 
 // ValidateAuth checks if the request has a valid API key using constant-time comparison.
 func (h *Handler) ValidateAuth(r *http.Request) bool {
-	authHeader := r.Header.Get("Authorization")
-	expectedAuth := "Bearer " + h.apiKey
-	return subtle.ConstantTimeCompare([]byte(authHeader), []byte(expectedAuth)) == 1
+	return h.apiKey.MatchesBearer(r.Header.Get("Authorization"))
+}
+
+// RequireAuth wraps a handler so it only runs for requests with a valid API key.
+func (h *Handler) RequireAuth(next http.HandlerFunc) http.HandlerFunc {
+	return func(w http.ResponseWriter, r *http.Request) {
+		if !h.ValidateAuth(r) {
+			http.Error(w, `{"error":"Unauthorized"}`, http.StatusUnauthorized)
+			return
+		}
+		next(w, r)
+	}
 }
 
 var (
@@ -110,6 +118,18 @@ type WebhookResponse struct {
 	UpdatedAt  time.Time `json:"updated_at"`
 }
 
+// newWebhookResponse converts a webhook registration to its API representation (without the secret).
+func newWebhookResponse(reg storage.WebhookRegistration) WebhookResponse {
+	return WebhookResponse{
+		ID:         reg.ID,
+		URL:        reg.URL,
+		EventTypes: reg.EventTypes,
+		Active:     reg.Active,
+		CreatedAt:  reg.CreatedAt,
+		UpdatedAt:  reg.UpdatedAt,
+	}
+}
+
 // CreateWebhook handles POST /api/webhooks
 func (h *Handler) CreateWebhook(w http.ResponseWriter, r *http.Request) {
 	var req CreateWebhookRequest
@@ -141,30 +161,25 @@ func (h *Handler) CreateWebhook(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// Create webhook registration
+	now := time.Now()
 	webhook := storage.WebhookRegistration{
 		ID:         uuid.New().String(),
 		URL:        req.URL,
 		Secret:     req.Secret,
 		EventTypes: req.EventTypes,
 		Active:     true,
-		CreatedAt:  time.Now(),
-		UpdatedAt:  time.Now(),
+		CreatedAt:  now,
+		UpdatedAt:  now,
 	}
 
 	if err := h.store.CreateWebhook(webhook); err != nil {
 		http.Error(w, `{"error":"Failed to create webhook"}`, http.StatusInternalServerError)
 		return
 	}
+	h.manager.InvalidateCache()
 
 	// Return response
-	resp := WebhookResponse{
-		ID:         webhook.ID,
-		URL:        webhook.URL,
-		EventTypes: webhook.EventTypes,
-		Active:     webhook.Active,
-		CreatedAt:  webhook.CreatedAt,
-		UpdatedAt:  webhook.UpdatedAt,
-	}
+	resp := newWebhookResponse(webhook)
 
 	w.Header().Set("Content-Type", "application/json")
 	w.WriteHeader(http.StatusCreated)
@@ -179,55 +194,53 @@ func (h *Handler) ListWebhooks(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	var resp []WebhookResponse
-	for _, wh := range webhooks {
-		resp = append(resp, WebhookResponse{
-			ID:         wh.ID,
-			URL:        wh.URL,
-			EventTypes: wh.EventTypes,
-			Active:     wh.Active,
-			CreatedAt:  wh.CreatedAt,
-			UpdatedAt:  wh.UpdatedAt,
-		})
+	resp := make([]WebhookResponse, len(webhooks))
+	for i, wh := range webhooks {
+		resp[i] = newWebhookResponse(wh)
 	}
 
 	w.Header().Set("Content-Type", "application/json")
 	_ = json.NewEncoder(w).Encode(map[string]any{"webhooks": resp})
 }
 
-// HandleWebhookByID routes requests to specific webhook endpoints.
-func (h *Handler) HandleWebhookByID(w http.ResponseWriter, r *http.Request) {
-	// Extract webhook ID from path
-	parts := strings.Split(strings.TrimPrefix(r.URL.Path, "/api/webhooks/"), "/")
-	if len(parts) == 0 || parts[0] == "" {
-		http.Error(w, `{"error":"Webhook ID required"}`, http.StatusBadRequest)
-		return
-	}
-
-	webhookID := parts[0]
-
-	// Check for test endpoint
-	if len(parts) == 2 && parts[1] == "test" && r.Method == http.MethodPost {
-		h.TestWebhook(w, r, webhookID)
-		return
-	}
+// RegisterRoutes registers the webhook management API on mux.
+// Routes are matched by method and path, and all of them require authentication.
+func (h *Handler) RegisterRoutes(mux *http.ServeMux) {
+	mux.HandleFunc("POST /api/webhooks", h.RequireAuth(h.CreateWebhook))
+	mux.HandleFunc("GET /api/webhooks", h.RequireAuth(h.ListWebhooks))
+
+	// {$} accepts a single trailing slash, as the previous path-splitting router did
+	for _, path := range []string{"/api/webhooks/{id}", "/api/webhooks/{id}/{$}"} {
+		mux.HandleFunc("GET "+path, h.RequireAuth(withWebhookID(h.GetWebhook)))
+		mux.HandleFunc("PUT "+path, h.RequireAuth(withWebhookID(h.UpdateWebhook)))
+		mux.HandleFunc("DELETE "+path, h.RequireAuth(withWebhookID(h.DeleteWebhook)))
+	}
+	mux.HandleFunc("POST /api/webhooks/{id}/test", h.RequireAuth(withWebhookID(h.TestWebhook)))
+	mux.HandleFunc("GET /api/webhooks/{id}/stats", h.RequireAuth(withWebhookID(h.GetWebhookStats)))
+
+	// Method-less fallbacks match any request under the API that no route above
+	// accepts, so authentication still runs first and errors stay JSON instead
+	// of ServeMux's plain-text 405.
+	mux.HandleFunc("/api/webhooks", h.RequireAuth(methodNotAllowed))
+	mux.HandleFunc("/api/webhooks/", h.RequireAuth(func(w http.ResponseWriter, r *http.Request) {
+		// no ID after the prefix, as the old path-splitting router reported
+		if r.URL.Path == "/api/webhooks/" {
+			http.Error(w, `{"error":"Webhook ID required"}`, http.StatusBadRequest)
+			return
+		}
+		methodNotAllowed(w, r)
+	}))
+}
 
-	// Check for stats endpoint
-	if len(parts) == 2 && parts[1] == "stats" && r.Method == http.MethodGet {
-		h.GetWebhookStats(w, r, webhookID)
-		return
-	}
+// methodNotAllowed rejects requests that match no webhook API route.
+func methodNotAllowed(w http.ResponseWriter, r *http.Request) {
+	http.Error(w, `{"error":"Method not allowed"}`, http.StatusMethodNotAllowed)
+}
 
-	// Route by method
-	switch r.Method {
-	case http.MethodGet:
-		h.GetWebhook(w, r, webhookID)
-	case http.MethodPut:
-		h.UpdateWebhook(w, r, webhookID)
-	case http.MethodDelete:
-		h.DeleteWebhook(w, r, webhookID)
-	default:
-		http.Error(w, `{"error":"Method not allowed"}`, http.StatusMethodNotAllowed)
+// withWebhookID adapts a handler that takes a webhook ID to the {id} path wildcard.
+func withWebhookID(next func(http.ResponseWriter, *http.Request, string)) http.HandlerFunc {
+	return func(w http.ResponseWriter, r *http.Request) {
+		next(w, r, r.PathValue("id"))
 	}
 }
 
@@ -239,14 +252,7 @@ func (h *Handler) GetWebhook(w http.ResponseWriter, r *http.Request, webhookID s
 		return
 	}
 
-	resp := WebhookResponse{
-		ID:         webhook.ID,
-		URL:        webhook.URL,
-		EventTypes: webhook.EventTypes,
-		Active:     webhook.Active,
-		CreatedAt:  webhook.CreatedAt,
-		UpdatedAt:  webhook.UpdatedAt,
-	}
+	resp := newWebhookResponse(*webhook)
 
 	w.Header().Set("Content-Type", "application/json")
 	_ = json.NewEncoder(w).Encode(resp)
@@ -306,26 +312,14 @@ func (h *Handler) UpdateWebhook(w http.ResponseWriter, r *http.Request, webhookI
 		webhook.Active = *req.Active
 	}
 
-	if err := h.store.UpdateWebhook(*webhook); err != nil {
+	// UpdateWebhook sets UpdatedAt on success, so the row doesn't need to be re-read
+	if err := h.store.UpdateWebhook(webhook); err != nil {
 		http.Error(w, `{"error":"Failed to update webhook"}`, http.StatusInternalServerError)
 		return
 	}
+	h.manager.InvalidateCache()
 
-	// Get updated webhook to ensure UpdatedAt field is current
-	updatedWebhook, err := h.store.GetWebhook(webhookID)
-	if err != nil {
-		http.Error(w, `{"error":"Failed to retrieve updated webhook"}`, http.StatusInternalServerError)
-		return
-	}
-
-	resp := WebhookResponse{
-		ID:         updatedWebhook.ID,
-		URL:        updatedWebhook.URL,
-		EventTypes: updatedWebhook.EventTypes,
-		Active:     updatedWebhook.Active,
-		CreatedAt:  updatedWebhook.CreatedAt,
-		UpdatedAt:  updatedWebhook.UpdatedAt,
-	}
+	resp := newWebhookResponse(*webhook)
 
 	w.Header().Set("Content-Type", "application/json")
 	_ = json.NewEncoder(w).Encode(resp)
@@ -337,6 +331,7 @@ func (h *Handler) DeleteWebhook(w http.ResponseWriter, r *http.Request, webhookI
 		http.Error(w, `{"error":"Webhook not found"}`, http.StatusNotFound)
 		return
 	}
+	h.manager.InvalidateCache()
 
 	w.WriteHeader(http.StatusNoContent)
 }
@@ -350,16 +345,17 @@ func (h *Handler) TestWebhook(w http.ResponseWriter, r *http.Request, webhookID
 	}
 
 	// Create a test payload
+	now := time.Now()
 	testPayload := WebhookPayload{
 		ID:        uuid.New().String(),
 		EventType: "message.received",
-		Timestamp: time.Now(),
+		Timestamp: now,
 		Data: MessageEventData{
 			MessageID:   "TEST-" + uuid.New().String(),
 			ChatJID:     "test@s.whatsapp.net",
 			SenderJID:   "test@s.whatsapp.net",
 			Text:        "This is a test message from WhatsApp MCP webhook system",
-			Timestamp:   time.Now(),
+			Timestamp:   now,
 			IsFromMe:    false,
 			MessageType: "text",
 			ChatName:    "Test Chat",
@@ -2,7 +2,10 @@ package webhook
 
 import (
 	"context"
+	"encoding/json"
+	"fmt"
 	"net/http"
+	"slices"
 	"strings"
 	"sync"
 	"time"
@@ -57,9 +60,11 @@ type MediaReference struct {
 
 // deliveryTask represents a webhook delivery job.
 type deliveryTask struct {
-	webhook storage.WebhookRegistration
-	payload WebhookPayload
-	attempt int
+	webhook   storage.WebhookRegistration
+	payload   WebhookPayload
+	attempt   int
+	body      []byte // serialized payload, shared by all subscribers of an event and reused by retries
+	signature string // HMAC signature of body (empty if the webhook has no secret)
 }
 
 // Logger defines the logging interface for the webhook manager.
@@ -78,19 +83,27 @@ type WebhookManager struct {
 	cancel       context.CancelFunc
 	wg           sync.WaitGroup
 	log          Logger
+
+	// cache of active webhooks subscribed to message events, refreshed after Config.CacheTTL
+	cacheMu               sync.Mutex
+	cachedMessageWebhooks []storage.WebhookRegistration
+	cacheValid            bool
+	cachedAt              time.Time
 }
 
 // NewWebhookManager creates a new webhook manager.
 func NewWebhookManager(store *storage.WebhookStore, config *Config, logger Logger) *WebhookManager {
 	ctx, cancel := context.WithCancel(context.Background())
 
+	// start from the default transport to keep its dialer, TLS and HTTP/2 settings
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 100
+	transport.MaxIdleConnsPerHost = 10
+	transport.IdleConnTimeout = 90 * time.Second
+
 	httpClient := &http.Client{
-		Timeout: config.DeliveryTimeout,
-		Transport: &http.Transport{
-			MaxIdleConns:        100,
-			MaxIdleConnsPerHost: 10,
-			IdleConnTimeout:     90 * time.Second,
-		},
+		Timeout:   config.DeliveryTimeout,
+		Transport: transport,
 	}
 
 	return &WebhookManager{
@@ -138,23 +151,29 @@ func (m *WebhookManager) Stop() {
 
 // EmitMessageEvent emits a message event to all registered webhooks.
 func (m *WebhookManager) EmitMessageEvent(msg storage.MessageWithNames) error {
-	webhooks, err := m.store.ListWebhooks(true) // active only
+	webhooks, err := m.messageSubscribers()
 	if err != nil {
 		return err
 	}
 
+	if len(webhooks) == 0 {
+		return nil
+	}
+
 	payload := m.buildMessagePayload(msg)
 
-	for _, webhook := range webhooks {
-		// Filter by event types
-		if !contains(webhook.EventTypes, "message") {
-			continue
-		}
+	// Serialize once for all subscribers; the body is read-only from here on
+	body, err := json.Marshal(payload)
+	if err != nil {
+		return fmt.Errorf("failed to marshal payload: %w", err)
+	}
 
+	for _, webhook := range webhooks {
 		// Enqueue delivery task (non-blocking)
 		task := &deliveryTask{
 			webhook: webhook,
 			payload: payload,
+			body:    body,
 			attempt: 1,
 		}
 
@@ -170,6 +189,46 @@ func (m *WebhookManager) EmitMessageEvent(msg storage.MessageWithNames) error {
 	return nil
 }
 
+// messageSubscribers returns the active webhooks subscribed to message events.
+// The event type filter runs once per cache refresh rather than on every message,
+// and results are cached for Config.CacheTTL so message events don't query the database each time.
+func (m *WebhookManager) messageSubscribers() ([]storage.WebhookRegistration, error) {
+	m.cacheMu.Lock()
+	defer m.cacheMu.Unlock()
+
+	if m.cacheValid && time.Since(m.cachedAt) < m.config.CacheTTL {
+		return m.cachedMessageWebhooks, nil
+	}
+
+	webhooks, err := m.store.ListWebhooks(true) // active only
+	if err != nil {
+		return nil, err
+	}
+
+	subscribers := webhooks[:0]
+	for _, webhook := range webhooks {
+		if slices.Contains(webhook.EventTypes, "message") {
+			subscribers = append(subscribers, webhook)
+		}
+	}
+
+	m.cachedMessageWebhooks = subscribers
+	m.cacheValid = true
+	m.cachedAt = time.Now()
+
+	return subscribers, nil
+}
+
+// InvalidateCache drops the cached webhook registrations so the next event reloads them.
+// It must be called after any change to the webhook_registrations table.
+func (m *WebhookManager) InvalidateCache() {
+	m.cacheMu.Lock()
+	defer m.cacheMu.Unlock()
+
+	m.cachedMessageWebhooks = nil
+	m.cacheValid = false
+}
+
 // buildMessagePayload converts a storage message to a webhook payload.
 func (m *WebhookManager) buildMessagePayload(msg storage.MessageWithNames) WebhookPayload {
 	eventType := "message.received"
@@ -230,8 +289,7 @@ func (m *WebhookManager) worker(id int) {
 	for {
 		select {
 		case task := <-m.deliveryChan:
-			m.log.Printf("Worker %d processing webhook %s", id, task.webhook.ID)
-			if err := m.deliverWebhook(task.webhook, task.payload, task.attempt); err != nil {
+			if err := m.deliverWebhook(task); err != nil {
 				// Schedule retry if attempts remain and backoff configuration is available
 				if task.attempt < m.config.MaxRetries && task.attempt < len(m.config.RetryBackoff) {
 					backoff := m.config.RetryBackoff[task.attempt]
@@ -260,18 +318,12 @@ func (m *WebhookManager) worker(id int) {
 	}
 }
 
-// contains checks if a slice contains a specific string.
-func contains(slice []string, item string) bool {
-	for _, s := range slice {
-		if s == item {
-			return true
-		}
-	}
-	return false
-}
-
 // TestDelivery sends a test webhook payload for manual testing purposes.
 // This is a synchronous operation that bypasses the worker queue.
 func (m *WebhookManager) TestDelivery(webhook storage.WebhookRegistration, payload WebhookPayload) error {
-	return m.deliverWebhook(webhook, payload, 1)
+	return m.deliverWebhook(&deliveryTask{
+		webhook: webhook,
+		payload: payload,
+		attempt: 1,
+	})
 }
@@ -1,6 +1,7 @@
 package whatsapp
 
 import (
+	"bufio"
 	"context"
 	"fmt"
 	"os"
@@ -30,77 +31,167 @@ type Client struct {
 	webhookManager   WebhookManager // optional webhook manager
 	mediaConfig      MediaConfig
 	log              waLog.Logger
-	logFile          *os.File
+	logFile          *bufferedFile
 	historySyncChans map[string]chan bool // tracks pending sync requests by chat JID
 	historySyncMux   sync.Mutex           // protects the map
+	pushNameCache    map[string]string    // push names by JID, loaded from the database on first use
+	pushNameMux      sync.Mutex           // protects pushNameCache
+	groupNames       map[string]string    // group names by canonical JID, in front of the chats table
+	groupNamesMux    sync.RWMutex         // protects groupNames
 	ctx              context.Context      // client lifecycle context
 	cancel           context.CancelFunc   // cancel function to stop all goroutines
 }
 
+// logFileFlushInterval is how often buffered log lines are flushed to disk.
+const logFileFlushInterval = time.Second
+
+// bufferedFile buffers log lines in memory and flushes them to the underlying file
+// periodically, so logging does not issue a write syscall per line.
+type bufferedFile struct {
+	mu   sync.Mutex
+	file *os.File
+	buf  *bufio.Writer
+}
+
+// newBufferedFile wraps an open file with a write buffer.
+func newBufferedFile(file *os.File) *bufferedFile {
+	return &bufferedFile{
+		file: file,
+		buf:  bufio.NewWriterSize(file, 64*1024),
+	}
+}
+
+// printf appends a formatted line with the given level prefix.
+// Warnings and errors are flushed immediately so they survive a crash.
+func (f *bufferedFile) printf(level, msg string, args ...any) {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	fmt.Fprintf(f.buf, "["+level+"] "+msg+"\n", args...)
+	if level == "WARN" || level == "ERROR" {
+		_ = f.buf.Flush()
+	}
+}
+
+// flush writes any buffered lines to the file.
+func (f *bufferedFile) flush() error {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	return f.buf.Flush()
+}
+
+// flushLoop flushes the buffer every interval until ctx is cancelled.
+func (f *bufferedFile) flushLoop(ctx context.Context, interval time.Duration) {
+	ticker := time.NewTicker(interval)
+	defer ticker.Stop()
+
+	for {
+		select {
+		case <-ctx.Done():
+			return
+		case <-ticker.C:
+			_ = f.flush()
+		}
+	}
+}
+
+// Close flushes remaining lines and closes the file.
+func (f *bufferedFile) Close() error {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	if err := f.buf.Flush(); err != nil {
+		f.file.Close()
+		return err
+	}
+	return f.file.Close()
+}
+
+// Log levels in increasing severity, matching the names accepted for LOG_LEVEL.
+const (
+	levelDebug = iota
+	levelInfo
+	levelWarn
+	levelError
+)
+
+// logLevels maps LOG_LEVEL names to their severity.
+var logLevels = map[string]int{
+	"DEBUG": levelDebug,
+	"INFO":  levelInfo,
+	"WARN":  levelWarn,
+	"ERROR": levelError,
+}
+
 // fileLogger wraps a logger to write to both stdout and a file.
+// Messages below minLevel are not written to the file, mirroring the stdout logger.
 type fileLogger struct {
-	base waLog.Logger
-	file *os.File
+	base     waLog.Logger
+	file     *bufferedFile
+	minLevel int
 }
 
 // Errorf logs an error message to both stdout and file.
 func (l *fileLogger) Errorf(msg string, args ...any) {
 	l.base.Errorf(msg, args...)
-	fmt.Fprintf(l.file, "[ERROR] "+msg+"\n", args...)
+	l.file.printf("ERROR", msg, args...)
 }
 
 // Warnf logs a warning message to both stdout and file.
 func (l *fileLogger) Warnf(msg string, args ...any) {
 	l.base.Warnf(msg, args...)
-	fmt.Fprintf(l.file, "[WARN] "+msg+"\n", args...)
+	if l.minLevel <= levelWarn {
+		l.file.printf("WARN", msg, args...)
+	}
 }
 
 // Infof logs an info message to both stdout and file.
 func (l *fileLogger) Infof(msg string, args ...any) {
 	l.base.Infof(msg, args...)
-	fmt.Fprintf(l.file, "[INFO] "+msg+"\n", args...)
+	if l.minLevel <= levelInfo {
+		l.file.printf("INFO", msg, args...)
+	}
 }
 
 // Debugf logs a debug message to both stdout and file.
 func (l *fileLogger) Debugf(msg string, args ...any) {
 	l.base.Debugf(msg, args...)
-	fmt.Fprintf(l.file, "[DEBUG] "+msg+"\n", args...)
+	if l.minLevel <= levelDebug {
+		l.file.printf("DEBUG", msg, args...)
+	}
 }
 
 // Sub creates a sub-logger for a specific module.
 func (l *fileLogger) Sub(module string) waLog.Logger {
 	return &fileLogger{
-		base: l.base.Sub(module),
-		file: l.file,
+		base:     l.base.Sub(module),
+		file:     l.file,
+		minLevel: l.minLevel,
 	}
 }
 
 // NewClient creates a new WhatsApp client with the given configuration.
 func NewClient(store *storage.MessageStore, mediaStore *storage.MediaStore, webhookManager WebhookManager, logLevel string) (*Client, error) {
 	// validate log level, default to INFO if invalid
-	validLevels := map[string]bool{
-		"DEBUG": true,
-		"INFO":  true,
-		"WARN":  true,
-		"ERROR": true,
-	}
-	if !validLevels[logLevel] {
+	minLevel, ok := logLevels[logLevel]
+	if !ok {
 		logLevel = "INFO"
+		minLevel = levelInfo
 	}
 
 	// create log file in data directory
-	logFile, err := os.OpenFile(paths.WhatsAppLogPath, os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0666)
+	file, err := os.OpenFile(paths.WhatsAppLogPath, os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0666)
 	if err != nil {
 		return nil, fmt.Errorf("failed to open log file: %w", err)
 	}
+	logFile := newBufferedFile(file)
 
 	// create base logger for stdout
 	baseLogger := waLog.Stdout("whatsapp", logLevel, true)
 
 	// Wrap with file logger
 	logger := &fileLogger{
-		base: baseLogger,
-		file: logFile,
+		base:     baseLogger,
+		file:     logFile,
+		minLevel: minLevel,
 	}
 
 	logger.Infof("Initializing WhatsApp client with log level: %s (logging to %s)", logLevel, paths.WhatsAppLogPath)
@@ -112,15 +203,22 @@ func NewClient(store *storage.MessageStore, mediaStore *storage.MediaStore, webh
 		mediaConfig.AutoDownloadMaxSize/(1024*1024),
 		getEnabledTypes(mediaConfig.AutoDownloadTypes))
 
+	// clean up media downloads interrupted by a previous crash
+	if err := removePartialDownloads(mediaConfig.StoragePath); err != nil {
+		logger.Warnf("Failed to remove partial media downloads: %v", err)
+	}
+
 	ctx := context.Background()
 
 	container, err := sqlstore.New(ctx, "sqlite", "file:"+paths.WhatsAppAuthDBPath+"?_pragma=foreign_keys(1)&_pragma=journal_mode(WAL)&_pragma=busy_timeout(5000)", logger)
 	if err != nil {
+		logFile.Close() // flush lines buffered so far; the caller exits on this error
 		return nil, fmt.Errorf("failed to create sqlstore: %w", err)
 	}
 
 	deviceStore, err := container.GetFirstDevice(ctx)
 	if err != nil {
+		logFile.Close() // flush lines buffered so far; the caller exits on this error
 		return nil, fmt.Errorf("failed to get  device: %w", err)
 	}
 
@@ -138,12 +236,15 @@ func NewClient(store *storage.MessageStore, mediaStore *storage.MediaStore, webh
 		log:              logger,
 		logFile:          logFile,
 		historySyncChans: make(map[string]chan bool),
+		groupNames:       make(map[string]string),
 		ctx:              clientCtx,
 		cancel:           cancel,
 	}
 
 	waClient.AddEventHandler(client.eventHandler)
 
+	go logFile.flushLoop(clientCtx, logFileFlushInterval)
+
 	return client, nil
 }
 
@@ -171,6 +272,14 @@ func (c *Client) Disconnect() {
 	}
 }
 
+// FlushLog writes buffered log lines to the log file.
+// Call it before exiting without Disconnect (e.g. log.Fatal), or the last lines are lost.
+func (c *Client) FlushLog() {
+	if c.logFile != nil {
+		_ = c.logFile.flush()
+	}
+}
+
 // GetQRChannel returns a channel for receiving QR codes for authentication.
 func (c *Client) GetQRChannel(ctx context.Context) (<-chan whatsmeow.QRChannelItem, error) {
 	if c.IsLoggedIn() {
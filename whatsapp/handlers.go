@@ -3,6 +3,7 @@ package whatsapp
 import (
 	"context"
 	"errors"
+	"maps"
 	"sync"
 	"time"
 
@@ -83,14 +84,24 @@ type messageData struct {
 	ReplyToID   string // ID of message being replied to or reacted to (for reactions/replies)
 }
 
-// getGroupInfoCached fetches group info with database caching to avoid excessive API calls.
+// getGroupInfoCached fetches group info with in-memory and database caching to avoid excessive API calls.
 func (c *Client) getGroupInfoCached(ctx context.Context, groupJID types.JID) (string, error) {
-	// try to load from database first
 	chatJID := c.normalizeJID(groupJID)
+
+	// try the in-memory cache first
+	c.groupNamesMux.RLock()
+	name, ok := c.groupNames[chatJID]
+	c.groupNamesMux.RUnlock()
+	if ok {
+		return name, nil
+	}
+
+	// then the database
 	existingChat, err := c.store.GetChatByJID(chatJID)
 	if err == nil && existingChat != nil && existingChat.PushName != "" {
 		// use cached name
 		c.log.Debugf("Using cached group name for %s: %s", groupJID, existingChat.PushName)
+		c.cacheGroupName(chatJID, existingChat.PushName)
 		return existingChat.PushName, nil
 	}
 
@@ -100,9 +111,22 @@ func (c *Client) getGroupInfoCached(ctx context.Context, groupJID types.JID) (st
 		return "", err
 	}
 
+	c.cacheGroupName(chatJID, groupInfo.Name)
+
 	return groupInfo.Name, nil
 }
 
+// cacheGroupName stores a group name in the in-memory cache.
+// Empty names are ignored, matching SaveChat, which keeps the stored name when given "".
+func (c *Client) cacheGroupName(chatJID, name string) {
+	if name == "" {
+		return
+	}
+	c.groupNamesMux.Lock()
+	c.groupNames[chatJID] = name
+	c.groupNamesMux.Unlock()
+}
+
 // getSenderPushName returns the sender's display name.
 // It tries PushName from the message first, then falls back to the contact store for groups.
 func (c *Client) getSenderPushName(ctx context.Context, senderJID types.JID, messagePushName string, isGroup bool, isFromMe bool) string {
@@ -215,6 +239,8 @@ func (c *Client) processMessageData(ctx context.Context, data messageData) error
 		pushNames := map[string]string{data.SenderJID.String(): senderPushName}
 		if err := c.store.SavePushNames(pushNames); err != nil {
 			c.log.Debugf("Failed to save push name for %s: %v", data.SenderJID, err)
+		} else {
+			c.cachePushNames(pushNames)
 		}
 	}
 
@@ -224,6 +250,36 @@ func (c *Client) processMessageData(ctx context.Context, data messageData) error
 	return nil
 }
 
+// loadPushNames returns a copy of the known push names, loading them from the database on first use.
+// The copy lets history sync add names without holding the lock while it processes conversations.
+func (c *Client) loadPushNames() (map[string]string, error) {
+	c.pushNameMux.Lock()
+	defer c.pushNameMux.Unlock()
+
+	if c.pushNameCache == nil {
+		pushNames, err := c.store.LoadAllPushNames()
+		if err != nil {
+			return nil, err
+		}
+		c.pushNameCache = pushNames
+	}
+
+	return maps.Clone(c.pushNameCache), nil
+}
+
+// cachePushNames records push names that were saved to the database in the in-memory cache.
+func (c *Client) cachePushNames(pushNames map[string]string) {
+	c.pushNameMux.Lock()
+	defer c.pushNameMux.Unlock()
+
+	// not loaded yet; the first loadPushNames call reads them from the database
+	if c.pushNameCache == nil {
+		return
+	}
+
+	maps.Copy(c.pushNameCache, pushNames)
+}
+
 // parseHistoryMessage parses a WebMessageInfo from history sync into messageData.
 // It returns nil if the message cannot be parsed.
 func (c *Client) parseHistoryMessage(chatJID types.JID, msg *waWeb.WebMessageInfo, pushNameMap map[string]string) *messageData {
@@ -529,6 +585,7 @@ func (c *Client) handleGroupInfo(evt *events.GroupInfo) {
 			c.log.Errorf("Failed to update group name: %v", err)
 			return
 		}
+		c.cacheGroupName(groupJID, evt.Name.Name)
 
 		c.log.Infof("Updated group name: %s -> %s", evt.JID, evt.Name.Name)
 	}
@@ -560,7 +617,7 @@ func (c *Client) handleHistorySync(evt *events.HistorySync) {
 
 	ctx := context.Background()
 
-	pushNameMap, err := c.store.LoadAllPushNames()
+	pushNameMap, err := c.loadPushNames()
 	if err != nil {
 		c.log.Errorf("Failed to load existing push names: %v", err)
 		pushNameMap = make(map[string]string)
@@ -582,6 +639,7 @@ func (c *Client) handleHistorySync(evt *events.HistorySync) {
 		if err := c.store.SavePushNames(newPushNames); err != nil {
 			c.log.Errorf("Failed to save push names to database: %v", err)
 		} else {
+			c.cachePushNames(newPushNames)
 			c.log.Infof("Saved %d new push names to database (total: %d)", len(newPushNames), len(pushNameMap))
 		}
 	} else {
@@ -692,10 +750,12 @@ func (c *Client) handleHistorySync(evt *events.HistorySync) {
 	// save chats BEFORE messages (for foreign key constraint)
 	if len(chatMap) > 0 {
 		c.log.Infof("Updating %d chat names from history sync", len(chatMap))
+		chats := make([]storage.Chat, 0, len(chatMap))
 		for _, chat := range chatMap {
-			if err := c.store.SaveChat(*chat); err != nil {
-				c.log.Warnf("Failed to update chat %s: %v", chat.JID, err)
-			}
+			chats = append(chats, *chat)
+		}
+		if err := c.store.SaveChats(chats); err != nil {
+			c.log.Warnf("Failed to update chats: %v", err)
 		}
 	}
 
@@ -714,18 +774,29 @@ func (c *Client) handleHistorySync(evt *events.HistorySync) {
 	if len(allMediaMetadata) > 0 {
 		c.log.Infof("Saving %d media metadata records from history sync", len(allMediaMetadata))
 
-		savedCount := 0
 		pendingDownloads := []storage.MediaMetadata{}
 
-		for _, mediaMetadata := range allMediaMetadata {
-			if err := c.mediaStore.SaveMediaMetadata(mediaMetadata); err != nil {
-				c.log.Warnf("Failed to save media metadata for %s: %v", mediaMetadata.MessageID, err)
-			} else {
-				savedCount++
-				// collect media that needs auto-download
-				if mediaMetadata.DownloadStatus == "pending" {
-					pendingDownloads = append(pendingDownloads, mediaMetadata)
+		// save in one transaction; if that fails, fall back to per-record saves
+		// so one bad record doesn't drop the whole batch
+		saved := make([]storage.MediaMetadata, 0, len(allMediaMetadata))
+		if err := c.mediaStore.SaveMediaMetadataBulk(allMediaMetadata); err == nil {
+			saved = allMediaMetadata
+		} else {
+			c.log.Warnf("Bulk media metadata save failed, saving records individually: %v", err)
+			for _, mediaMetadata := range allMediaMetadata {
+				if err := c.mediaStore.SaveMediaMetadata(mediaMetadata); err != nil {
+					c.log.Warnf("Failed to save media metadata for %s: %v", mediaMetadata.MessageID, err)
+					continue
 				}
+				saved = append(saved, mediaMetadata)
+			}
+		}
+
+		savedCount := len(saved)
+		for _, mediaMetadata := range saved {
+			// collect media that needs auto-download
+			if mediaMetadata.DownloadStatus == "pending" {
+				pendingDownloads = append(pendingDownloads, mediaMetadata)
 			}
 		}
 
@@ -821,6 +892,7 @@ func (c *Client) handleHistorySync(evt *events.HistorySync) {
 		if err := c.store.SavePushNames(additionalPushNames); err != nil {
 			c.log.Errorf("Failed to save additional push names: %v", err)
 		} else {
+			c.cachePushNames(additionalPushNames)
 			c.log.Infof("Saved %d additional push names from messages", len(additionalPushNames))
 		}
 	}
@@ -2,10 +2,8 @@ package whatsapp
 
 import (
 	"context"
-	"crypto/sha256"
 	"errors"
 	"fmt"
-	"io"
 	"os"
 	"path/filepath"
 	"strings"
@@ -210,14 +208,7 @@ func (c *Client) downloadMedia(ctx context.Context, msg *waE2E.Message, meta *st
 		return "", fmt.Errorf("failed to create directory: %w", err)
 	}
 
-	// create file
-	file, err := os.Create(filePath)
-	if err != nil {
-		return "", fmt.Errorf("failed to create file: %w", err)
-	}
-	defer file.Close()
-
-	// download to file using whatsmeow's Download method
+	// download using whatsmeow's Download method
 	var data []byte
 	switch d := downloadable.(type) {
 	case *waE2E.ImageMessage:
@@ -235,20 +226,13 @@ func (c *Client) downloadMedia(ctx context.Context, msg *waE2E.Message, meta *st
 	}
 
 	if err != nil {
-		os.Remove(filePath)
 		return "", err
 	}
 
-	// write data to file
-	if _, err := file.Write(data); err != nil {
-		os.Remove(filePath)
-		return "", fmt.Errorf("failed to write file: %w", err)
-	}
-
-	// verify download
-	if err := c.verifyDownload(filePath, meta); err != nil {
-		os.Remove(filePath)
-		return "", fmt.Errorf("verification failed: %w", err)
+	// write to a temp file in the same directory and rename it into place,
+	// so readers never see a partially written media file
+	if err := c.writeMediaFile(filePath, data, meta); err != nil {
+		return "", err
 	}
 
 	// compute relative file path
@@ -265,6 +249,56 @@ func (c *Client) downloadMedia(ctx context.Context, msg *waE2E.Message, meta *st
 	return relPath, nil
 }
 
+// partialDownloadsDir is the directory, under the media storage path, where
+// downloads are written before being renamed into place. It is on the same
+// filesystem as the final files, so the rename is atomic.
+const partialDownloadsDir = ".partial"
+
+// removePartialDownloads deletes media files left half-written by a previous run
+// that stopped between writing and renaming them.
+func removePartialDownloads(storagePath string) error {
+	return os.RemoveAll(filepath.Join(storagePath, partialDownloadsDir))
+}
+
+// writeMediaFile atomically writes downloaded media to filePath.
+// The data is written and verified in the partial downloads directory, then renamed over filePath.
+func (c *Client) writeMediaFile(filePath string, data []byte, meta *storage.MediaMetadata) error {
+	partialDir := filepath.Join(c.mediaConfig.StoragePath, partialDownloadsDir)
+	if err := os.MkdirAll(partialDir, 0755); err != nil {
+		return fmt.Errorf("failed to create directory: %w", err)
+	}
+
+	// same flags and mode as os.Create, so the umask still applies
+	tmpPath := filepath.Join(partialDir, filepath.Base(filePath))
+	tmp, err := os.OpenFile(tmpPath, os.O_RDWR|os.O_CREATE|os.O_TRUNC, 0666)
+	if err != nil {
+		return fmt.Errorf("failed to create file: %w", err)
+	}
+
+	if _, err := tmp.Write(data); err != nil {
+		tmp.Close()
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to write file: %w", err)
+	}
+	if err := tmp.Close(); err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to write file: %w", err)
+	}
+
+	// verify download
+	if err := c.verifyDownload(tmpPath, meta); err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("verification failed: %w", err)
+	}
+
+	if err := os.Rename(tmpPath, filePath); err != nil {
+		os.Remove(tmpPath)
+		return fmt.Errorf("failed to move file into place: %w", err)
+	}
+
+	return nil
+}
+
 // generateMediaFilePath creates a unique file path based on media metadata.
 func (c *Client) generateMediaFilePath(meta *storage.MediaMetadata) (string, error) {
 	// determine subdirectory based on MIME type
@@ -399,27 +433,28 @@ func sanitizeFilename(name string) string {
 	return filename
 }
 
+// mimeExtensions maps common MIME types to file extensions.
+var mimeExtensions = map[string]string{
+	"image/jpeg":      ".jpg",
+	"image/jpg":       ".jpg",
+	"image/png":       ".png",
+	"image/gif":       ".gif",
+	"image/webp":      ".webp",
+	"video/mp4":       ".mp4",
+	"video/3gpp":      ".3gp",
+	"video/quicktime": ".mov",
+	"audio/ogg":       ".ogg",
+	"audio/mpeg":      ".mp3",
+	"audio/mp4":       ".m4a",
+	"audio/aac":       ".aac",
+	"application/pdf": ".pdf",
+	"application/zip": ".zip",
+	"text/plain":      ".txt",
+}
+
 // mimeToExtension converts a MIME type to a file extension.
 func mimeToExtension(mime string) string {
-	extensions := map[string]string{
-		"image/jpeg":      ".jpg",
-		"image/jpg":       ".jpg",
-		"image/png":       ".png",
-		"image/gif":       ".gif",
-		"image/webp":      ".webp",
-		"video/mp4":       ".mp4",
-		"video/3gpp":      ".3gp",
-		"video/quicktime": ".mov",
-		"audio/ogg":       ".ogg",
-		"audio/mpeg":      ".mp3",
-		"audio/mp4":       ".m4a",
-		"audio/aac":       ".aac",
-		"application/pdf": ".pdf",
-		"application/zip": ".zip",
-		"text/plain":      ".txt",
-	}
-
-	if ext, ok := extensions[mime]; ok {
+	if ext, ok := mimeExtensions[mime]; ok {
 		return ext
 	}
 
@@ -431,19 +466,3 @@ func mimeToExtension(mime string) string {
 
 	return ""
 }
-
-// hashFile computes the SHA256 hash of a file.
-func hashFile(path string) ([]byte, error) {
-	file, err := os.Open(path)
-	if err != nil {
-		return nil, err
-	}
-	defer file.Close()
-
-	hasher := sha256.New()
-	if _, err := io.Copy(hasher, file); err != nil {
-		return nil, err
-	}
-
-	return hasher.Sum(nil), nil
-}